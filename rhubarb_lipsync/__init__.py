@@ -1,15 +1,10 @@
-print("RLSP: enter __init__")
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import bpy
-from bpy.props import PointerProperty
 
-from .blender.auto_load import AutoLoader
-from .blender.capture_properties import CaptureListProperties
-from .blender.icons_manager import IconsManager
-from .blender.mapping_properties import MappingProperties
-from .blender.preferences import RhubarbAddonPreferences
-from .rhubarb.log_manager import logManager
+if TYPE_CHECKING:  # Imported for type-checking only, the runtime imports are deferred until `register()`
+    from .blender.auto_load import AutoLoader
+    from .blender.preferences import RhubarbAddonPreferences
 
 bl_info = {
     'name': 'Rhubarb Lipsync NG',
@@ -24,7 +19,25 @@ bl_info = {
     'category': 'Animation',
 }
 
-autoloader: Optional[AutoLoader]
+autoloader: Optional['AutoLoader']
+
+_lazy_attributes = {
+    'AutoLoader': '.blender.auto_load',
+    'CaptureListProperties': '.blender.capture_properties',
+    'IconsManager': '.blender.icons_manager',
+    'MappingProperties': '.blender.mapping_properties',
+    'RhubarbAddonPreferences': '.blender.preferences',
+    'logManager': '.rhubarb.log_manager',
+}
+
+
+def __getattr__(name: str):
+    """Resolve the re-exported addon classes lazily (PEP 562) to keep the module import cheap."""
+    if name in _lazy_attributes:
+        import importlib
+
+        return getattr(importlib.import_module(_lazy_attributes[name], __package__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_blender_in_debug() -> bool:
@@ -32,11 +45,18 @@ def is_blender_in_debug() -> bool:
     return bpy.app.debug or bpy.app.debug_python
 
 
-def init_loggers(prefs: Optional[RhubarbAddonPreferences]) -> None:
+def init_loggers(prefs: Optional['RhubarbAddonPreferences']) -> None:
     global autoloader
+    from .rhubarb.log_manager import logManager
+
     if is_blender_in_debug():
         print("RLPS: enter init_loggers() ")
-    logManager.init(autoloader.modules)
+    if autoloader is not None:
+        logManager.init(autoloader.modules)
+    else:
+        from . import registry
+
+        logManager.init(registry.modules)
 
     if is_blender_in_debug():  # If Blender is in debug, force TRACE loglevel
         logManager.set_trace()
@@ -53,16 +73,30 @@ def init_loggers(prefs: Optional[RhubarbAddonPreferences]) -> None:
 
 def register() -> None:
     global autoloader
+    # Deferred imports so Blender's addon scanner can pick up `bl_info` without loading the whole addon
+    from bpy.props import PointerProperty
+
+    from .blender.capture_properties import CaptureListProperties
+    from .blender.mapping_properties import MappingProperties
+    from .blender.preferences import RhubarbAddonPreferences
 
     if is_blender_in_debug():
         print("RLPS: enter register() ")
     RhubarbAddonPreferences.bl_idname = __package__
-    autoloader = AutoLoader(root_init_file=__file__, root_package_name=__package__)
-    try:
-        autoloader.find_classes()
-        autoloader.register()
-    finally:
-        autoloader.trace_print_str()
+    if is_blender_in_debug():  # Dev mode, scan and toposort the classes dynamically to catch new/changed ones
+        from .blender.auto_load import AutoLoader
+
+        autoloader = AutoLoader(root_init_file=__file__, root_package_name=__package__)
+        try:
+            autoloader.find_classes()
+            autoloader.register()
+        finally:
+            autoloader.trace_print_str()
+    else:  # Register the pre-declared class tuple, no package scanning
+        from . import registry
+
+        autoloader = None
+        registry.register_classes()
 
     bpy.types.Scene.rhubarb_lipsync_captures = PointerProperty(type=CaptureListProperties)
     bpy.types.Object.rhubarb_lipsync_mapping = PointerProperty(
@@ -71,6 +105,10 @@ def register() -> None:
         override={'LIBRARY_OVERRIDABLE'},
     )
 
+    from .blender import capture_panel
+
+    capture_panel.subscribe_sounds()  # Only installs handlers, the initial sound scan is deferred (bpy.data is restricted here)
+
     prefs = RhubarbAddonPreferences.from_context(bpy.context, False)
     init_loggers(prefs)
     if hasattr(prefs, 'capture_tab_name'):  # Re-set the tab names in case they differ from defaults
@@ -82,13 +120,19 @@ def register() -> None:
 
 def unregister() -> None:
     global autoloader
+    from .blender import capture_panel
+    from .blender.icons_manager import IconsManager
+
+    capture_panel.unsubscribe_sounds()
     IconsManager.unregister()
     # if 'logManager' in globals():
     #     global logManager
     #     del logManager
-    autoloader.unregister()
+    if autoloader is not None:
+        autoloader.unregister()
+    else:
+        from . import registry
+
+        registry.unregister_classes()
     del bpy.types.Scene.rhubarb_lipsync_captures
     del bpy.types.Object.rhubarb_lipsync_mapping
-
-
-print("RLSP: exit __init__")
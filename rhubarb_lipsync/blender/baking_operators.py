@@ -1,5 +1,6 @@
 import logging
 import textwrap
+from typing import Optional
 
 import bpy
 from bpy.props import BoolProperty, EnumProperty
@@ -50,14 +51,26 @@ class RemoveCapturedNlaStrips(bpy.types.Operator):
         if not track:
             return
         self.tracks_cleaned += 1
-        strips = list(bctx.strips_on_track(track))
-        log.debug(f"Going to remove {len(strips)}")
-        for strip in strips:
-            track.strips.remove(strip)
-            self.strips_removed += 1
+        if bctx.total_frame_range is None:
+            return
+        start, end = bctx.total_frame_range
+        strips_coll = track.strips
+        removed = 0
+        # Iterate in reverse on the collection itself so removals don't shift the remaining indices.
+        # Avoids materializing all the strip RNA wrappers into a temporary list first.
+        for i in range(len(strips_coll) - 1, -1, -1):
+            s = strips_coll[i]
+            if s.frame_end < start or s.frame_start > end:
+                continue  # Strip is not in frame range
+            strips_coll.remove(s)
+            removed += 1
+        if self._debug_on:
+            log.debug(f"Removed {removed} strips")
+        self.strips_removed += removed
 
     def on_object(self, bctx: baking_utils.BakingContext) -> None:
-        log.debug(f"Removing strips from {bctx.current_object}")
+        if self._debug_on:
+            log.debug(f"Removing strips from {bctx.current_object}")
         for t in bctx.unique_tracks:
             self.on_track(bctx, t)
 
@@ -65,6 +78,7 @@ class RemoveCapturedNlaStrips(bpy.types.Operator):
         b = baking_utils.BakingContext(ctx)
         self.strips_removed = 0
         self.tracks_cleaned = 0
+        self._debug_on = log.isEnabledFor(logging.DEBUG)  # Hoisted out of the per-track/per-object loop
         if not b.objects:
             self.report({'ERROR'}, "No matching object in selection")
             return {'CANCELLED'}
@@ -232,17 +246,16 @@ class BakeToNLA(bpy.types.Operator):
 
         rll: ResultLogListProperties = CaptureListProperties.from_context(context).last_resut_log
         rll.clear()  # Clear log entries from last bake
+        self.bctx = baking_utils.BakingContext(context)  # Reused by draw() across the dialog redraws
         wm = context.window_manager
         return wm.invoke_props_dialog(self, width=480)
 
-    def to_strip(self) -> None:
+    def compute_cue_placement(self) -> tuple[float, float, float, float]:
+        """Strip start/end and blend in/out frames of the current cue.
+        Depends only on the cue and the placement preferences, so it is computed once per cue
+        and shared by all the baked objects."""
         b = self.bctx
         cf = b.current_cue
-        cue: MouthCue = cf and cf.cue or None
-        if not b.current_mapping_action:
-            with b.rlog.check_dups() as log:
-                log.warning(f"There is no mapping for the cue {cue.key} in the capture. Ignoring", self.bctx.current_traceback)
-            return
 
         # start = cue_frames.pre_start_frame_float  # The clip starts slightly before the cue start driven by the blend-in value
 
@@ -267,12 +280,29 @@ class BakeToNLA(bpy.types.Operator):
             end = next_cf.get_middle_start_frame(bir)
             blend_out = end - cf.get_middle_end_frame_float(bir)
 
-        desired_strip_duration = end - start
-        assert desired_strip_duration > 0, f"desired_strip_duration={desired_strip_duration} [{b.current_traceback}]"
+        assert end - start > 0, f"desired_strip_duration={end - start} [{b.current_traceback}]"
         assert blend_in >= 0, f"blend_in={blend_in} [{b.current_traceback}]"
         assert blend_out >= 0, f"blend_out={blend_out} [{b.current_traceback}]"
+        return start, end, blend_in, blend_out
+
+    def to_strip(self) -> None:
+        b = self.bctx
+        cf = b.current_cue
+        cue: MouthCue = cf and cf.cue or None
+        if not b.current_mapping_action:
+            with b.rlog.check_dups() as log:
+                log.warning(f"There is no mapping for the cue {cue.key} in the capture. Ignoring", self.bctx.current_traceback)
+            return
+
+        # Computed lazily so unmapped cues never hit the placement asserts,
+        # then shared by all the other baked objects visiting the same cue
+        placement = self._placements.get(b.cue_index)
+        if placement is None:
+            placement = self.compute_cue_placement()
+            self._placements[b.cue_index] = placement
+        start, end, blend_in, blend_out = placement
         # Try to scale the strip to the cue duration
-        scale = b.current_mapping_action_scale(desired_strip_duration)
+        scale = b.current_mapping_action_scale(end - start)
 
         self.place_strip(start, end, blend_in, blend_out, scale)
 
@@ -314,28 +344,38 @@ class BakeToNLA(bpy.types.Operator):
                 strip.blend_in = blend_in
                 strip.blend_out = blend_out
 
-    def bake_cue_on_object(self, obj: Object) -> None:
+    def bake_object(self, obj: Object) -> None:
+        """Bake all the cues on the current object, one track at a time.
+        Strips are inserted strictly in frame order per track so the NLA track only ever appends at its end."""
         b = self.bctx
-
-        track = b.current_track
-        if not track:
-            if b.cue_index <= 0:  # Only log the error 1x
-                b.rlog.error(f"{obj and obj.name} has no NLA track selected. Ignoring", self.bctx.current_traceback)
+        wm = b.ctx.window_manager
+        if b.track_pair is None:
+            b.rlog.error(f"{obj and obj.name} has no NLA track selected. Ignoring", self.bctx.current_traceback)
             return
-        self.to_strip()
-
-    def bake_cue(self) -> None:
-        for obj in self.bctx.object_iter():
-            assert self.bctx.current_cue, "No cue selected"
-            # print(self.bctx.cue_index)
-            if log.isEnabledFor(logging.TRACE):  # type: ignore
-                log.trace(f"Baking on object {obj} ")  # type: ignore
-            self.bake_cue_on_object(obj)
+        t1, t2 = b.track_pair
+        cue_count = len(b.cue_processor.cue_frames)
+        # Cue #i goes to the pair position (i+1)&1, keeping the track alternation.
+        if t1 == t2:  # Single track, visit all the cues in frame order
+            passes: list[tuple[Optional[int], range]] = [(None, range(cue_count))]
+        else:
+            passes = [(1, range(0, cue_count, 2)), (0, range(1, cue_count, 2))]
+        for position, indices in passes:
+            for i in indices:
+                b.track_index = (i + 1) & 1 if position is None else position
+                cue_frames = b.set_current_cue(i)
+                wm.progress_update(i)
+                if self._trace_on:
+                    log.trace(f"Baking cue {cue_frames.cue} on object {obj} ")  # type: ignore
+                self.to_strip()
+        b.clear_current_cue()
 
     def execute(self, ctx: Context) -> set[str]:
         self.bctx = baking_utils.BakingContext(ctx)
         self.strips_added = 0
         b = self.bctx
+        # Hoisted out of the per-cue/per-object loops, each isEnabledFor call locks and walks the logger chain
+        self._trace_on = log.isEnabledFor(logging.TRACE)  # type: ignore
+        self._debug_on = log.isEnabledFor(logging.DEBUG)
 
         wm = ctx.window_manager
         l = len(b.mouth_cue_items)
@@ -343,15 +383,15 @@ class BakeToNLA(bpy.types.Operator):
         wm.progress_begin(0, l)
         try:
             b.optimize_cues()
-            # Loop over cues and for each cue alternate between the two tracks and for each track loop over all objects
             log.debug("Optimization done. Placing NLA strips")
-            for i, cue_frames in enumerate(b.cue_iter()):
-                # print(b.cue_index)
-                wm.progress_update(i)
-                if log.isEnabledFor(logging.DEBUG):
-                    log.debug(f"Baking cue {cue_frames.cue} ({i}/{l}) ")
-                self.bctx.next_track()
-                self.bake_cue()
+            # Strip geometry depends only on the cues. Each mapped cue is computed once
+            # (lazily, in to_strip) and shared across all the objects
+            self._placements: dict[int, tuple[float, float, float, float]] = {}
+            # Loop over objects and for each object place the strips track by track in frame order
+            for obj in b.object_iter():
+                if self._debug_on:
+                    log.debug(f"Baking object {obj} ({l} cues)")
+                self.bake_object(obj)
 
             msg = f"Baked {l} cues to {self.strips_added} action strips"
             self.bctx.rlog.info(msg, self.bctx.current_traceback)
@@ -426,7 +466,10 @@ class BakeToNLA(bpy.types.Operator):
                     self.draw_error_inbox(box.row(), e)
 
     def draw(self, ctx: Context) -> None:
-        self.bctx = baking_utils.BakingContext(ctx)
+        if getattr(self, 'bctx', None) is None:
+            self.bctx = baking_utils.BakingContext(ctx)
+        else:  # Re-bind the current draw context but keep the caches. The objects-cache invalidates itself on selection changes
+            self.bctx.ctx = ctx
 
         layout = self.layout
         rootProps = self.bctx.clist_props
@@ -3,7 +3,7 @@ from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import bpy
 from bpy.types import Context, NlaStrip, NlaTrack, Object
@@ -20,12 +20,9 @@ from .strip_placement_preferences import StripPlacementPreferences
 log = logging.getLogger(__name__)
 
 
-def objects_with_mapping(objects: Iterator[Object]) -> Iterator[Object]:
+def objects_with_mapping(objects: Iterator[Object]) -> List[Object]:
     """Filter all objects with non-blank mapping properties"""
-    for o in objects or []:
-        mp = MappingProperties.from_object(o)
-        if mp and mp.has_any_mapping:
-            yield o
+    return [o for o in objects or [] if (mp := MappingProperties.from_object(o)) and mp.has_any_mapping]
 
 
 def find_strip_at(track: NlaTrack, at_frame: float) -> tuple[int, NlaStrip]:
@@ -76,35 +73,47 @@ class BakingContext:
     _objs: List[Object] = None
     object_index: int = -1
     track_index: int = 0
-    last_object_selection_type: str = ""
-
-    # def __post_init__(self) -> None:
-    #     self.clear_obj_cache()
-
-    @cached_property
-    def prefs(self) -> RhubarbAddonPreferences:
-        return RhubarbAddonPreferences.from_context(self.ctx)
-
-    @cached_property
-    def mprefs(self) -> MappingPreferences:
-        return self.prefs.mapping_prefs
+    _objs_key: Optional[Tuple] = None
+    _current_object: Optional[Object] = None
+    _current_cue: Optional[MouthCueFrames] = None
+    _mprops_cache: Optional[Dict[int, MappingProperties]] = None
+    _tracks_cache: Optional[Dict[int, Tuple[Optional[NlaTrack], Optional[NlaTrack]]]] = None
+    _validation_cache: Optional[Dict[int, Tuple[int, List[str]]]] = None
+
+    def __post_init__(self) -> None:
+        # Plain attributes are cheaper to read than cached_property descriptors and the context is short-lived anyway
+        self.prefs: RhubarbAddonPreferences = RhubarbAddonPreferences.from_context(self.ctx)
+        self.mprefs: MappingPreferences = self.prefs.mapping_prefs
+        self._refresh_capture()
+
+    def _refresh_capture(self) -> None:
+        self.cprops: CaptureProperties = CaptureListProperties.capture_from_context(self.ctx)
+        cl: Optional[MouthCueList] = self.cprops.cue_list if self.cprops else None
+        self.mouth_cue_items: list[MouthCueListItem] = cl.items if cl else []
 
     def clear_obj_cache(self) -> None:
         log.debug("Clearing obj cache")
         self._objs: List[Object] = None
         self.object_index = -1
+        self._current_object = None
         self.track_index = 0
-        self.last_object_selection_type = ""
+        self._objs_key = None
+        self._mprops_cache = None
+        self._tracks_cache = None
+        self._validation_cache = None
+        self._refresh_capture()  # The active capture might have changed too
 
     @property
     def objects(self) -> List[Object]:
-        """All objects to bake the cues on."""
-        if self.last_object_selection_type != self.mprefs.object_selection_filter_type:
-            self.clear_obj_cache()  # Selection type has changed, invalidate cache
-            self.last_object_selection_type = self.mprefs.object_selection_filter_type
+        """All objects to bake the cues on. Cached until the selection type or the selection itself changes."""
+        if self.object_index < 0:  # Don't invalidate mid-iteration, baking itself changes the selection
+            key = (self.mprefs.object_selection_filter_type, len(self.ctx.selected_objects), self.ctx.view_layer.objects.active)
+            if key != self._objs_key:  # Selection has changed, invalidate cache
+                self.clear_obj_cache()
+                self._objs_key = key
         if self._objs is None:  # Rebuild obj cache
             obj_sel = self.mprefs.object_selection_filtered(self.ctx)
-            self._objs = list(objects_with_mapping(obj_sel))
+            self._objs = objects_with_mapping(obj_sel)
         return self._objs
 
     def object_iter(self) -> Iterator[Object]:
@@ -112,25 +121,29 @@ class BakingContext:
         Note this function actually sets the current_object as a side effect so can't be used for concurrent looping."""
         for i, o in enumerate(self.objects):
             self.object_index = i
+            self._current_object = o
             yield o
         self.object_index = -1
+        self._current_object = None
 
     def next_object(self) -> Object:
+        """Advance to the next object explicitly (the non-iterator path)."""
         if not self.objects:
             self.object_index = -1
+            self._current_object = None
             return None
         self.object_index += 1
-        return self.current_object
+        if self.object_index >= len(self.objects):
+            self.object_index = -1
+            self._current_object = None
+            return None
+        self._current_object = self.objects[self.object_index]
+        return self._current_object
 
     @property
     def current_object(self) -> Object:
         """Current Blender Object with the mappings. It is changed as a side effect of the `object_iter`"""
-        if self.object_index < 0:
-            return None
-        if self.object_index >= len(self.objects):
-            self.object_index = -1
-            return None
-        return self.objects[self.object_index]
+        return self._current_object
 
     @property
     def use_shape_keys_for_current_object(self) -> bool:
@@ -141,10 +154,6 @@ class BakingContext:
             return False
         return bool(self.current_object.data.shape_keys)
 
-    @cached_property
-    def cprops(self) -> CaptureProperties:
-        return CaptureListProperties.capture_from_context(self.ctx)
-
     @property
     def clist_props(self) -> CaptureListProperties:
         return CaptureListProperties.from_context(self.ctx)
@@ -167,13 +176,6 @@ class BakingContext:
             trace = f"{trace}.{self.current_track.name}"
         return trace
 
-    @cached_property
-    def mouth_cue_items(self) -> list[MouthCueListItem]:
-        if not self.cprops or not self.cprops.cue_list:
-            return []
-        cl: MouthCueList = self.cprops.cue_list
-        return cl.items
-
     @cached_property
     def frame_cfg(self) -> FrameConfig:
         return MouthCueListItem.frame_config_from_context(self.ctx)
@@ -186,18 +188,25 @@ class BakingContext:
     def cue_iter(self) -> Iterator[MouthCueFrames]:
         for i, cf in enumerate(self.cue_processor.cue_frames):
             self.cue_index = i
+            self._current_cue = cf
             yield cf
         self.cue_index = -1
+        self._current_cue = None
+
+    def set_current_cue(self, index: int) -> MouthCueFrames:
+        """Make the cue at the given index the current one. For loops which don't visit the cues strictly in order."""
+        self.cue_index = index
+        self._current_cue = self.cue_processor.cue_frames[index]
+        return self._current_cue
+
+    def clear_current_cue(self) -> None:
+        self.cue_index = -1
+        self._current_cue = None
 
     @property
     def current_cue(self) -> Optional[MouthCueFrames]:
-        """Current mouth cue - source side of the mapping"""
-        if self.cue_index < 0:
-            return None
-        if self.cue_index >= len(self.cue_processor.cue_frames):
-            self.cue_index = -1
-            return None
-        return self.cue_processor.cue_frames[self.cue_index]
+        """Current mouth cue - source side of the mapping. It is changed as a side effect of the `cue_iter`"""
+        return self._current_cue
 
     @property
     def preceding_cue(self) -> Optional[MouthCueFrames]:
@@ -239,8 +248,18 @@ class BakingContext:
 
     @property
     def mprops(self) -> MappingProperties:
-        """Mapping properties of the current Object"""
-        return MappingProperties.from_object(self.current_object)
+        """Mapping properties of the current Object. Memoized per Object since the RNA lookup is repeated for each cue."""
+        co = self.current_object
+        if co is None:
+            return None
+        if self._mprops_cache is None:
+            self._mprops_cache = {}
+        key = co.as_pointer()  # Blender-stable id of the underlying Object
+        mp = self._mprops_cache.get(key)
+        if mp is None:
+            mp = MappingProperties.from_object(co)
+            self._mprops_cache[key] = mp
+        return mp
 
     @property
     def current_mapping_item(self) -> MappingItem:
@@ -282,22 +301,51 @@ class BakingContext:
 
     @property
     def track1(self) -> Optional[NlaTrack]:
-        track_ref: NlaTrackRef = self.mprops and self.mprops.nla_track1
-        return track_ref and track_ref.selected_item
+        # Explicit guards instead of an and-chain, each `and` would __bool__ the RNA object (an existence check)
+        mp = self.mprops
+        if mp is None:
+            return None
+        track_ref: NlaTrackRef = mp.nla_track1
+        if track_ref is None:
+            return None
+        return track_ref.selected_item
 
     @property
     def track2(self) -> Optional[NlaTrack]:
-        track_ref: NlaTrackRef = self.mprops and self.mprops.nla_track2
-        return track_ref and track_ref.selected_item
+        mp = self.mprops
+        if mp is None:
+            return None
+        track_ref: NlaTrackRef = mp.nla_track2
+        if track_ref is None:
+            return None
+        return track_ref.selected_item
+
+    @property
+    def raw_track_pair(self) -> Tuple[Optional[NlaTrack], Optional[NlaTrack]]:
+        """(track1, track2) of the current Object. Cached per Object since selecting a track is a linear NLA-track search."""
+        co = self.current_object
+        if co is None:
+            return None, None
+        if self._tracks_cache is None:
+            self._tracks_cache = {}
+        key = co.as_pointer()
+        pair = self._tracks_cache.get(key)
+        if pair is None:
+            pair = (self.track1, self.track2)
+            if pair == (None, None):
+                return pair  # No track selected (yet), don't cache so a later selection is picked up
+            self._tracks_cache[key] = pair
+        return pair
 
     @property
     def track_pair(self) -> Optional[Tuple[NlaTrack, NlaTrack]]:
         """Both tracks of the current object. The track can be repeated 2x if only singe track is selected."""
         if self.track_index < 0:
             return None
-        if self.track1 is None and self.track2 is None:
+        t1, t2 = self.raw_track_pair
+        if t1 is None and t2 is None:
             return None
-        return (self.track1 or self.track2, self.track2 or self.track1)
+        return (t1 or t2, t2 or t1)
 
     @property
     def unique_tracks(self) -> List[NlaTrack]:
@@ -313,19 +361,21 @@ class BakingContext:
 
     @property
     def has_two_tracks(self) -> bool:
-        return bool(self.track1 and self.track2) and self.track1 != self.track2
+        t1, t2 = self.raw_track_pair
+        return bool(t1 and t2) and t1 != t2
 
     @property
     def current_track(self) -> Optional[NlaTrack]:
         if self.track_index < 0:
             return None
-        if self.track_pair is None:
+        pair = self.track_pair  # Single property evaluation, the pair itself is cached per object
+        if pair is None:
             return None
-        return self.track_pair[self.track_index % 2]
+        return pair[self.track_index & 1]
 
     def next_track(self) -> Optional[NlaTrack]:
         """Alternates between non-null track_pair. If only one track is non-null it would always be the current track"""
-        self.track_index = (self.track_index + 1) % 2
+        self.track_index = (self.track_index + 1) & 1
         return self.current_track
 
     def strips_on_current_track(self) -> Iterator[NlaStrip]:
@@ -397,9 +447,32 @@ class BakingContext:
                 error_msg[msg] += [mi.key]
         return [tmpl.format(' '.join(keys), 'has' if len(keys) == 1 else 'have') for tmpl, keys in error_msg.items()]
 
+    def mapping_fingerprint(self) -> int:
+        """Cheap fingerprint of the current object's mapping. Changes whenever an Action gets (un)mapped."""
+        mp = self.mprops
+        if not mp:
+            return 0
+        return hash(tuple((mi.key, bool(mi.action)) for mi in mp.items))
+
     def validate_current_object(self) -> list[str]:
-        """Return validation errors of `self.object`."""
+        """Return validation errors of `self.object`.
+        Cached per Object so repeated dialog redraws don't re-walk the whole mapping.
+        The cache entry is keyed by a mapping fingerprint so edits re-validate; also invalidated with the objects cache."""
+        co = self.current_object
+        fingerprint = 0
+        if co is not None:
+            if self._validation_cache is None:
+                self._validation_cache = {}
+            fingerprint = self.mapping_fingerprint()
+            cached = self._validation_cache.get(co.as_pointer())
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+        ret = self._validate_current_object()
+        if co is not None:
+            self._validation_cache[co.as_pointer()] = (fingerprint, ret)
+        return ret
 
+    def _validate_current_object(self) -> list[str]:
         sel_errors = self.validate_selection()
         if sel_errors:
             return [sel_errors]
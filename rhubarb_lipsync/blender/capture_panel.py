@@ -1,18 +1,151 @@
+import functools
 import logging
-import pathlib
+import os.path
+import time
+from dataclasses import dataclass
 
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Context, Sound
 
 from .. import IconsManager
 from ..rhubarb import mouth_cues
-from . import capture_operators, rhubarb_operators, sound_operators, ui_utils
-from .capture_properties import CaptureListProperties, JobProperties, MouthCueList, MouthCueListItem
+from . import capture_operators, mapping_properties, rhubarb_operators, sound_operators, ui_utils
+from .capture_properties import CaptureListProperties, CaptureProperties, JobProperties, MouthCueList, MouthCueListItem
 from .cue_uilist import MouthCueUIList
 from .preferences import CueListPreferences, RhubarbAddonPreferences
 
 log = logging.getLogger(__name__)
 
+_path_exists_cache: dict[str, tuple[float, bool]] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _fps_label(fps: int, fps_base: float) -> str:
+    """Scene FPS formatted for the info sub-panel. Memoized, the frame-rate rarely changes."""
+    return f"{fps / fps_base:0.2f}"
+
+
+@functools.lru_cache(maxsize=16)
+def _job_status_title(status: str) -> str:
+    """Formatted button title for the given capture-job status. Memoized since the status
+    only changes a few times per capture while the panel redraws continuously."""
+    if not status:
+        return "Capture"
+    return f"Capture ({status})"
+
+
+def _cached_exists(filepath: str, ttl=1.0) -> bool:
+    """Stat-backed existence check cached for a short while. The panel draw() runs at UI frame-rate
+    and stat-ing the sound file on each redraw can get expensive (network mounts)."""
+    now = time.monotonic()
+    cached = _path_exists_cache.get(filepath)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    ret = os.path.isfile(filepath)
+    _path_exists_cache[filepath] = (now, ret)
+    return ret
+
+
+@dataclass(frozen=True)
+class SoundValidationSnapshot:
+    """Sound-file facts `draw_sound_setup` needs on every redraw. Kept in plain Python
+    so the repeated reads don't each cross the RNA boundary."""
+
+    packed: bool
+    exists: bool
+    samplerate: int
+    format_supported: bool
+    errors: bool
+
+
+_sound_snapshot_cache: dict[tuple, SoundValidationSnapshot] = {}
+
+
+def _sound_snapshot(props: CaptureProperties, sound: Sound) -> SoundValidationSnapshot:
+    """The samplerate/format fields only change together with the sound datablock or its filepath,
+    the mutable bits (packed, exists) are part of the cache key so they stay fresh."""
+    key = (sound.name_full, sound.filepath, bool(sound.packed_file), _cached_exists(sound.filepath))
+    snap = _sound_snapshot_cache.get(key)
+    if snap is None:
+        if len(_sound_snapshot_cache) > 64:
+            _sound_snapshot_cache.clear()
+        _ensure_subscribed(sound)  # A miss means a new/changed sound, watch its filepath edits
+        packed, exists = key[2], key[3]
+        format_supported = props.is_sound_format_supported()
+        errors = packed or not exists or not format_supported
+        snap = SoundValidationSnapshot(packed, exists, int(sound.samplerate), format_supported, errors)
+        _sound_snapshot_cache[key] = snap
+    return snap
+
+
+_msgbus_owner = object()
+_subscribed_sounds: set[int] = set()
+
+
+def _on_sound_filepath_changed() -> None:
+    """Notified by msgbus when a subscribed Sound's filepath is edited. Drops the cached
+    existence/validation results so the next redraw re-checks the disk right away."""
+    _path_exists_cache.clear()
+    _sound_snapshot_cache.clear()
+
+
+def _ensure_subscribed(sound: Sound) -> None:
+    key = sound.as_pointer()
+    if key in _subscribed_sounds:
+        return
+    _subscribed_sounds.add(key)
+    bpy.msgbus.subscribe_rna(key=sound.path_resolve("filepath", False), owner=_msgbus_owner, args=(), notify=_on_sound_filepath_changed)
+
+
+def _subscribe_all_sounds() -> None:
+    """(Re)subscribe to filepath changes of all the loaded Sound datablocks.
+    Must not run during addon registration where `bpy.data` is still restricted."""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribed_sounds.clear()
+    _path_exists_cache.clear()
+    _sound_snapshot_cache.clear()
+    for sound in bpy.data.sounds:
+        _ensure_subscribed(sound)
+
+
+def _initial_sound_scan() -> None:
+    """One-shot timer callback doing the first sound scan shortly after registration."""
+    _subscribe_all_sounds()
+    return None  # Don't reschedule
+
+
+@persistent
+def _on_load_post(_file=None) -> None:
+    mapping_properties.clear_caches()  # The cached track wrappers are dangling after a file load
+    _subscribe_all_sounds()
+
+
+@persistent
+def _on_undo_post(_scene=None) -> None:
+    mapping_properties.clear_caches()  # Undo can free/reuse the RNA pointers behind the cached tracks
+
+
+def subscribe_sounds() -> None:
+    """Called on addon registration. Blender runs `register()` with `bpy.data` restricted,
+    so only the handlers are installed here and the initial scan over the existing sounds is
+    deferred to a one-shot timer. Sounds opened later get subscribed lazily on the first draw."""
+    if not any(h is _on_load_post for h in bpy.app.handlers.load_post):
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if not any(h is _on_undo_post for h in bpy.app.handlers.undo_post):
+        bpy.app.handlers.undo_post.append(_on_undo_post)
+    if not bpy.app.timers.is_registered(_initial_sound_scan):
+        bpy.app.timers.register(_initial_sound_scan, first_interval=0)
+
+
+def unsubscribe_sounds() -> None:
+    if bpy.app.timers.is_registered(_initial_sound_scan):
+        bpy.app.timers.unregister(_initial_sound_scan)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribed_sounds.clear()
+    ui_utils.remove_handler(bpy.app.handlers.load_post, _on_load_post)
+    ui_utils.remove_handler(bpy.app.handlers.undo_post, _on_undo_post)
+
 
 class CaptureExtraOptionsPanel(bpy.types.Panel):
     bl_idname = "RLPS_PT_capture_extra_options"
@@ -85,6 +218,29 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
     # bl_description = "Tool tip"
     # bl_context = "object"
 
+    # Operator ids bound once at import time. The draw methods run at UI frame-rate
+    # and the module.class.attribute chains add up there.
+    _TOGGLE_REL_ID = sound_operators.ToggleRelativePath.bl_idname
+    _CONVERT_ID = sound_operators.ConvertSoundFromat.bl_idname
+    _CREATE_STRIP_ID = sound_operators.CreateSoundStripWithSound.bl_idname
+    _REMOVE_STRIP_ID = sound_operators.RemoveSoundStripWithSound.bl_idname
+    _PROCESS_ID = rhubarb_operators.ProcessSoundFile.bl_idname
+    _GET_VERSION_ID = rhubarb_operators.GetRhubarbExecutableVersion.bl_idname
+    _EXPORT_JSON_ID = capture_operators.ExportCueList2Json.bl_idname
+    _IMPORT_JSON_ID = capture_operators.ImportJsonCueList.bl_idname
+    _CLEAR_CUES_ID = capture_operators.ClearCueList.bl_idname
+    _CREATE_CAPTURE_ID = capture_operators.CreateCaptureProps.bl_idname
+    _DELETE_CAPTURE_ID = capture_operators.DeleteCaptureProps.bl_idname
+    _EXTRA_OPTIONS_ID = CaptureExtraOptionsPanel.bl_idname
+    _CUE_LIST_OPTIONS_ID = CueListOptionsPanel.bl_idname
+    _MOUTH_CUE_LIST_ID = MouthCueUIList.bl_idname
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        # Captures hang off the Scene (not the active Object), so a scene is all that is needed.
+        # When this returns False Blender skips the whole draw() tree for the panel.
+        return context.scene is not None
+
     @staticmethod
     def on_cuelist_index_changed(cueList: MouthCueList, ctx: Context, item: MouthCueListItem) -> None:
         # Even handler called when the cue list index changes in the properties.
@@ -97,16 +253,17 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
     MouthCueList.index_changed = on_cuelist_index_changed  # Register callback
 
     def draw_sound_setup(self) -> bool:
-        props = CaptureListProperties.capture_from_context(self.ctx)
-        prefs = RhubarbAddonPreferences.from_context(self.ctx)
-        sound: Sound = props and props.sound
+        props = self.props
+        prefs = self.prefs
+        sound: Sound = self.sound
 
         # Redundant validations to allow collapsing this sub-panel while still indicating any errors
         if sound is None:
             errors = True
-        else:
-            path = pathlib.Path(sound.filepath)
-            errors = not sound or sound.packed_file or not path.exists or not props.is_sound_format_supported()
+            snap = None
+        else:  # Single snapshot serves both the collapsed-header indication and the expanded body
+            snap = _sound_snapshot(props, sound)
+            errors = snap.errors
         if not ui_utils.draw_expandable_header(prefs, "sound_source_panel_expanded", "Input Sound Setup", self.layout, errors):
             return not errors
         layout = self.layout
@@ -122,19 +279,19 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
         row = layout.row(align=True)
         row.prop(sound, "filepath", text="")
 
-        blid = sound_operators.ToggleRelativePath.bl_idname
+        blid = self._TOGGLE_REL_ID
 
         op = row.operator(blid, text="", icon="DOT").relative = True
-        if props.sound_file_path and not props.sound_file_path.exists():
-            absp = pathlib.Path(ui_utils.to_abs_path(sound.filepath))
-            if absp.exists():
+        if sound.filepath and not snap.packed and not snap.exists:
+            # The (possibly Blender-relative) path doesn't resolve but the absolute one does
+            if os.path.isfile(ui_utils.to_abs_path(sound.filepath)):
                 row.alert = True
 
         op = row.operator(blid, text="", icon="ITALIC").relative = False
 
         row = layout.row(align=True)
-        row.operator(sound_operators.CreateSoundStripWithSound.bl_idname, icon='SPEAKER').start_frame = props.start_frame
-        row.operator(sound_operators.RemoveSoundStripWithSound.bl_idname, icon='MUTE_IPO_OFF')
+        row.operator(self._CREATE_STRIP_ID, icon='SPEAKER').start_frame = props.start_frame
+        row.operator(self._REMOVE_STRIP_ID, icon='MUTE_IPO_OFF')
         layout.prop(props, 'start_frame')
         layout.prop(self.ctx.scene, 'use_audio_scrub')
         layout.prop(self.ctx.scene, 'sync_mode')
@@ -143,31 +300,31 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
         if sound:
             layout.prop(sound, "use_memory_cache")
 
-        if sound.packed_file:
+        if snap.packed:
             ui_utils.draw_error(self.layout, "Rhubarb requires the file on disk.\n Please unpack the sound.")
             unpackop = layout.operator("sound.unpack", icon='PACKAGE', text=f"Unpack '{sound.name}'")
             unpackop.id = sound.name_full  # type: ignore
             unpackop.method = 'USE_ORIGINAL'  # type: ignore
             return False
 
-        if not path.exists:
+        if not snap.exists:
             ui_utils.draw_error(self.layout, "Sound file doesn't exist.")
             return False
 
         convert = False
 
-        if sound.samplerate < 16 * 1000:
+        if snap.samplerate < 16 * 1000:
             ui_utils.draw_error(self.layout, "Only samplerate >16k supported")
             convert = True
 
-        if not props.is_sound_format_supported():
+        if not snap.format_supported:
             ui_utils.draw_error(self.layout, "Only wav or ogg supported.")
             convert = True
 
         if convert or prefs.always_show_conver:
             row = layout.row(align=True)
             row.label(text="Convert to")
-            blid = sound_operators.ConvertSoundFromat.bl_idname
+            blid = self._CONVERT_ID
 
             op = row.operator(blid, text="ogg")
             op.codec = 'ogg'  # type: ignore
@@ -182,11 +339,10 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
         return True
 
     def draw_info(self) -> None:
-        props = CaptureListProperties.capture_from_context(self.ctx)
-        prefs = RhubarbAddonPreferences.from_context(self.ctx)
-
-        if not ui_utils.draw_expandable_header(prefs, "info_panel_expanded", "Additional Info", self.layout):
+        # Header check first, the info fields below are only fetched when the sub-panel is expanded
+        if not ui_utils.draw_expandable_header(self.prefs, "info_panel_expanded", "Additional Info", self.layout):
             return
+        props = self.props
         box = self.layout.box().column(align=True)
         # line = layout.split()
         if props and props.sound:
@@ -208,23 +364,18 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
         if ver:  # Cached value, just show
             line.label(text=ver)
         else:  # Not cached, offer button
-            line.operator(rhubarb_operators.GetRhubarbExecutableVersion.bl_idname)
+            line.operator(self._GET_VERSION_ID)
 
         line = box.split()
         line.label(text="FPS")
         r = self.ctx.scene.render
-
-        line.label(text=f"{r.fps/r.fps_base:0.2f}")
-
-    def get_job_status_title(self, status: str) -> str:
-        if not status:
-            return "Capture"
-        return f"Capture ({status})"
+        line.label(text=_fps_label(r.fps, r.fps_base))
 
     def get_cue_icon(self, cue_list: MouthCueList) -> int:
         # When animation is running follow the icon from the cue list=> preview
-        cp: CueListPreferences = RhubarbAddonPreferences.from_context(self.ctx).cue_list_prefs
-        if getattr(self.ctx.screen, 'is_animation_playing', False) and cp.preview:
+        cp: CueListPreferences = self.prefs.cue_list_prefs
+        scr = self.ctx.screen  # Direct attribute access, the getattr-with-default was only guarding a None screen
+        if scr is not None and scr.is_animation_playing and cp.preview:
             # https://blender.stackexchange.com/questions/211184/how-to-tag-a-redraw-in-all-viewports
             # self.ctx.area.tag_redraw()  # Force redraw
             ui_utils.redraw_3dviews(self.ctx)
@@ -241,12 +392,12 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
         return IconsManager.logo_icon()
 
     def draw_job(self) -> None:
-        props = CaptureListProperties.capture_from_context(self.ctx)
+        props = self.props
         jprops: JobProperties = props.job
         cue_list: MouthCueList = props.cue_list
         layout = self.layout
 
-        title = self.get_job_status_title(jprops.status)
+        title = _job_status_title(jprops.status)
         row = layout.row(align=True)
 
         # box = row.box()
@@ -256,8 +407,8 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
 
         row = row.row(align=True)
         row.scale_y = 2
-        row.operator(rhubarb_operators.ProcessSoundFile.bl_idname, text=title)
-        row.popover(panel=CaptureExtraOptionsPanel.bl_idname, text="", icon="DOWNARROW_HLT")
+        row.operator(self._PROCESS_ID, text=title)
+        row.popover(panel=self._EXTRA_OPTIONS_ID, text="", icon="DOWNARROW_HLT")
 
         if jprops.running:
             row = layout.row(align=True)
@@ -271,8 +422,7 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
             ui_utils.draw_error(layout, jprops.error)
 
     def draw_capture_toolbar(self) -> None:
-        prefs = RhubarbAddonPreferences.from_context(self.ctx)
-        cpref: CueListPreferences = prefs.cue_list_prefs
+        cpref: CueListPreferences = self.prefs.cue_list_prefs
 
         row = self.layout.row()
 
@@ -282,19 +432,19 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
 
         actionRow = row.row(align=True)
         actionRow.label(text="")  # Spacer to force icons alight to the right
-        actionRow.operator(capture_operators.ExportCueList2Json.bl_idname, text="", icon="EXPORT")
-        actionRow.operator(capture_operators.ImportJsonCueList.bl_idname, text="", icon="IMPORT")
-        actionRow.popover(panel=CueListOptionsPanel.bl_idname, text="", icon="VIS_SEL_11")
-        actionRow.operator(capture_operators.ClearCueList.bl_idname, text="", icon="PANEL_CLOSE")
+        actionRow.operator(self._EXPORT_JSON_ID, text="", icon="EXPORT")
+        actionRow.operator(self._IMPORT_JSON_ID, text="", icon="IMPORT")
+        actionRow.popover(panel=self._CUE_LIST_OPTIONS_ID, text="", icon="VIS_SEL_11")
+        actionRow.operator(self._CLEAR_CUES_ID, text="", icon="PANEL_CLOSE")
 
     def draw_capture(self) -> None:
-        prefs = RhubarbAddonPreferences.from_context(self.ctx)
-        props = CaptureListProperties.capture_from_context(self.ctx)
+        prefs = self.prefs
+        props = self.props
         if not props:
             return
         jprops: JobProperties = props.job
 
-        title = self.get_job_status_title(jprops.status)
+        title = _job_status_title(jprops.status)
         error = bool(jprops.error)
 
         if not ui_utils.draw_expandable_header(prefs, "caputre_panel_expanded", title, self.layout, error):
@@ -305,11 +455,15 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
 
         list_type = 'GRID' if prefs.cue_list_prefs.as_grid else 'DEFAULT'
         lst: MouthCueList = props.cue_list
-        self.layout.template_list(MouthCueUIList.bl_idname, "Mouth cues", lst, "items", lst, "index", type=list_type)
+        self.layout.template_list(self._MOUTH_CUE_LIST_ID, "Mouth cues", lst, "items", lst, "index", type=list_type)
 
     def draw(self, context: Context) -> None:
         try:
             self.ctx = context
+            # Resolved once per redraw, the sub-draw methods read these instead of re-walking the context
+            self.props = CaptureListProperties.capture_from_context(context)
+            self.prefs = RhubarbAddonPreferences.from_context(context)
+            self.sound = self.props and self.props.sound
             layout = self.layout
             # layout.use_property_split = True
             # layout.use_property_decorate = False  # No animation.
@@ -332,10 +486,10 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
                 row = layout.row(align=True)
                 row.prop(rootProps, 'name', text="")
                 # row.prop(rootProps, 'index', text="")
-                row.operator(capture_operators.CreateCaptureProps.bl_idname, text="", icon="DUPLICATE")
-                row.operator(capture_operators.DeleteCaptureProps.bl_idname, text="", icon="PANEL_CLOSE")
+                row.operator(self._CREATE_CAPTURE_ID, text="", icon="DUPLICATE")
+                row.operator(self._DELETE_CAPTURE_ID, text="", icon="PANEL_CLOSE")
             else:
-                layout.operator(capture_operators.CreateCaptureProps.bl_idname, icon="DUPLICATE")
+                layout.operator(self._CREATE_CAPTURE_ID, icon="DUPLICATE")
 
             self.draw_sound_setup()
             self.draw_info()
@@ -347,3 +501,6 @@ class CaptureMouthCuesPanel(bpy.types.Panel):
             raise
         finally:
             self.ctx = None
+            self.props = None
+            self.prefs = None
+            self.sound = None
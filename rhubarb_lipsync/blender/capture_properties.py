@@ -135,15 +135,13 @@ class JobProperties(PropertyGroup):
 
     @property
     def running(self) -> bool:
-        return self.progress > 0 and self.progress != 100
+        p = self.progress  # Single RNA read, the panel polls this on every redraw
+        return 0 < p < 100
 
     def update_from_async_job(self, job: RhubarbCommandAsyncJob) -> None:
         self.progress = job.last_progress
         self.status = job.status
-        if not job.last_exception:
-            self.error = ""
-        else:
-            self.error = f"{type(job.last_exception).__name__}\n{' '.join(job.last_exception.args)}"
+        self.error = job.formatted_exception
 
 
 class CaptureProperties(PropertyGroup):
@@ -355,7 +353,7 @@ class CaptureListProperties(PropertyGroup):
         # return [(m, str(i)) for i, m in enumerate(materials)]
 
     def dropdown_helper(self, ctx: Context) -> DropdownHelper:
-        return DropdownHelper(self, list(self.search_names(ctx, "")), DropdownHelper.NameNotFoundHandling.SELECT_ANY)
+        return DropdownHelper(self, lambda: list(self.search_names(ctx, "")), DropdownHelper.NameNotFoundHandling.SELECT_ANY)
 
     def name_updated(self, ctx: Context) -> None:
         self.dropdown_helper(ctx).name2index()
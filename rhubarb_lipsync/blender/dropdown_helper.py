@@ -1,6 +1,6 @@
 import re
 from enum import Enum
-from typing import Sequence
+from typing import Callable, Optional, Sequence, Union
 
 
 class DropdownHelper:
@@ -12,15 +12,27 @@ class DropdownHelper:
     numbered_item_re = re.compile(r"^(?P<idx>\d+)\s.*")
     NameNotFoundHandling = Enum('NameNotFoundHandling', ['SELECT_ANY', 'UNSELECT'])
 
-    def __init__(self, dropdown, names: Sequence[str], nameNotFoundHandling=NameNotFoundHandling.SELECT_ANY) -> None:
+    def __init__(self, dropdown, names: Union[Sequence[str], Callable[[], Sequence[str]]], nameNotFoundHandling=NameNotFoundHandling.SELECT_ANY) -> None:
         self.obj = dropdown
-        self.names = names
+        # Names can be provided lazily as a callable so the list isn't built unless the dropdown is actually used
+        if callable(names):
+            self._names_fn: Optional[Callable[[], Sequence[str]]] = names
+            self._names: Optional[Sequence[str]] = None
+        else:
+            self._names_fn = None
+            self._names = names
         self.nameNotFoundHandling = nameNotFoundHandling
         # if nameNotFoundHandling == DropdownHelper.NameNotFoundHandling.UNSELECT:
         # self.index = -1
         # else
         # self.ensure_index_bounds()
 
+    @property
+    def names(self) -> Sequence[str]:
+        if self._names is None:
+            self._names = list(self._names_fn())  # type: ignore[misc]
+        return self._names
+
     @property
     def index(self) -> int:
         return getattr(self.obj, 'index', -1)
@@ -10,6 +10,7 @@ from .ui_utils import resources_path
 class IconsManager:
     _previews: bpy.utils.previews.ImagePreviewCollection = None
     _loaded: set[str] = set()
+    _logo_icon_id: int = 0
 
     @staticmethod
     def unregister() -> None:
@@ -18,6 +19,7 @@ class IconsManager:
             # bpy.utils.previews.remove(IconsManager._previews)
             IconsManager._previews = None
             IconsManager._loaded = set()
+            IconsManager._logo_icon_id = 0
 
     @staticmethod
     def get_icon(key: str) -> int:
@@ -55,7 +57,10 @@ class IconsManager:
 
     @staticmethod
     def logo_icon() -> int:
-        return IconsManager.get_icon('rhubarb64x64')
+        # Memoized since panels ask for the logo on every redraw
+        if not IconsManager._logo_icon_id:
+            IconsManager._logo_icon_id = IconsManager.get_icon('rhubarb64x64')
+        return IconsManager._logo_icon_id
         # return IconsManager.get('1.dat')
 
     @staticmethod
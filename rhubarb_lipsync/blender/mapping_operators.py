@@ -7,7 +7,7 @@ from bpy.props import EnumProperty, FloatProperty, IntProperty, StringProperty
 from bpy.types import Context, Object
 
 from .. import IconsManager
-from ..rhubarb.mouth_shape_info import MouthShapeInfo, MouthShapeInfos
+from ..rhubarb.mouth_shape_info import MOUTH_SHAPE_BY_KEY, MouthShapeInfo, MouthShapeInfos
 from . import mapping_utils, ui_utils
 from .mapping_properties import MappingItem, MappingProperties, NlaTrackRef
 from .preferences import MappingPreferences, RhubarbAddonPreferences
@@ -242,13 +242,12 @@ class ShowCueInfoHelp(bpy.types.Operator):
     @staticmethod
     def draw_popup(this: bpy.types.UIPopupMenu, key: str, context: Context) -> None:
         layout = this.layout
-        msi: MouthShapeInfo = MouthShapeInfos[key].value
+        msi: MouthShapeInfo = MOUTH_SHAPE_BY_KEY[key]
         # split = layout.split(factor=0.2)
         row = layout.row()
         row.template_icon(icon_value=IconsManager.cue_icon(key), scale=6)
         col = row.column(align=False)
-        lines = msi.description.splitlines()
-        for l in lines:
+        for l in msi.description_lines:
             col.label(text=l)
 
     @classmethod
@@ -265,7 +264,7 @@ class ShowCueInfoHelp(bpy.types.Operator):
             self.key = si.key
         mprops.index = MouthShapeInfos.key2index(self.key)
         draw = lambda this, ctx: ShowCueInfoHelp.draw_popup(this, self.key, ctx)
-        msi: MouthShapeInfo = MouthShapeInfos[self.key].value
+        msi: MouthShapeInfo = MOUTH_SHAPE_BY_KEY[self.key]
         title = f"{msi.key_displ}  {msi.short_dest}"
         context.window_manager.popup_menu(draw, title=f"{title:<25}", icon="INFO")
 
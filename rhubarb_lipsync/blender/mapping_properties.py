@@ -1,5 +1,4 @@
 import logging
-from functools import cached_property
 from typing import Any, Generator, Optional
 
 import bpy
@@ -7,13 +6,64 @@ import bpy.utils.previews
 from bpy.props import BoolProperty, CollectionProperty, FloatProperty, IntProperty, PointerProperty, StringProperty
 from bpy.types import Context, NlaTrack, PropertyGroup
 
-from ..rhubarb.mouth_shape_info import MouthShapeInfo, MouthShapeInfos
+from ..rhubarb.mouth_shape_info import MOUTH_SHAPE_BY_KEY, MouthShapeInfo, MouthShapeInfos
 from . import mapping_utils
 from .dropdown_helper import DropdownHelper
 
 log = logging.getLogger(__name__)
 
 
+class cached_property:
+    """Lock-free stand-in for functools.cached_property. The stdlib version (prior Python 3.12)
+    takes an RLock on every first access; these properties are hit from UI redraw callbacks
+    where the GIL already serializes the access."""
+
+    def __init__(self, fn) -> None:
+        self.fn = fn
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        val = self.fn(instance)
+        instance.__dict__[self.name] = val
+        return val
+
+
+_track_list_cache: dict[int, tuple[tuple[int, int, int, int], tuple[NlaTrack, ...]]] = {}
+
+
+def clear_caches() -> None:
+    """Drop the module caches holding live RNA wrappers. Called from the load_post/undo
+    handlers since the cached pointers may be dangling or reused after those."""
+    _track_list_cache.clear()
+
+
+def _cached_track_list(obj: bpy.types.Object, anim_data) -> tuple[NlaTrack, ...]:
+    """Materialized nla_tracks tuple memoized per object pointer. The key includes the
+    animation-data pointer, the track count and the boundary-track pointers, so adding,
+    removing or replacing tracks invalidates. UI redraw callbacks walk the track list
+    repeatedly and this keeps it O(1) on a hit."""
+    if not anim_data:
+        return ()
+    tracks = anim_data.nla_tracks
+    count = len(tracks)
+    if count:
+        key = (anim_data.as_pointer(), count, tracks[0].as_pointer(), tracks[count - 1].as_pointer())
+    else:
+        key = (anim_data.as_pointer(), 0, 0, 0)
+    obj_ptr = obj.as_pointer()
+    cached = _track_list_cache.get(obj_ptr)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    ret = tuple(tracks)
+    _track_list_cache[obj_ptr] = (key, ret)
+    return ret
+
+
 class NlaTrackRef(PropertyGroup):
     """Reference to an nla track. By name and index since NLA track is a non-ID object"""
 
@@ -27,30 +77,30 @@ class NlaTrackRef(PropertyGroup):
     def name_updated(self, ctx: Context) -> None:
         self.dropdown_helper.name2index()
 
-    def items(self) -> Generator[NlaTrack, Any, None]:
+    def track_list(self) -> tuple[NlaTrack, ...]:
         o = self.object
         if not o:
-            return
-        # For mesh provide shape-key actions only. But only if the object has any shape-keys created
-        if mapping_utils.does_object_support_shapekey_actions(o):
-            if not o.data or not o.data.shape_keys or not o.data.shape_keys.animation_data:
-                return
-            for t in o.data.shape_keys.animation_data.nla_tracks:
-                yield t
-            return
-
-        if not o.animation_data or not o.animation_data.nla_tracks:
-            return
-        for t in o.animation_data.nla_tracks:
-            yield t
+            return ()
+        # For mesh provide shape-key actions only. But only if the object has any shape-keys created.
+        # The dispatch reads each RNA attribute exactly once instead of going through
+        # does_object_support_shapekey_actions which re-reads the same chain.
+        if o.type == "MESH":
+            data = o.data
+            sk = data and data.shape_keys
+            if sk:
+                return _cached_track_list(o, sk.animation_data)
+        return _cached_track_list(o, o.animation_data)
+
+    def items(self) -> Generator[NlaTrack, Any, None]:
+        yield from self.track_list()
 
     def search_names(self, ctx: Context, edit_text) -> Generator[str, Any, None]:
-        for i, t in enumerate(self.items()):
+        for i, t in enumerate(self.track_list()):
             yield f"{str(i).zfill(3)} {t.name}"
 
     @cached_property
     def dropdown_helper(self) -> DropdownHelper:
-        return DropdownHelper(self, list(self.search_names(None, "")), DropdownHelper.NameNotFoundHandling.UNSELECT)
+        return DropdownHelper(self, lambda: list(self.search_names(None, "")), DropdownHelper.NameNotFoundHandling.UNSELECT)
 
     name: StringProperty(  # type: ignore
         name="NLA Track",
@@ -71,7 +121,7 @@ class NlaTrackRef(PropertyGroup):
     def selected_item(self) -> Optional[NlaTrack]:
         if not hasattr(self, 'index'):
             return None
-        items = list(self.items())
+        items = self.track_list()
         if self.index < 0 or self.index >= len(items):
             return None
         # self.dropdown_helper(ctx).index2name()
@@ -160,7 +210,7 @@ class MappingItem(PropertyGroup):
     def cue_info(self) -> Optional[MouthShapeInfo]:
         if not self.key:
             return None
-        return MouthShapeInfos[self.key].value
+        return MOUTH_SHAPE_BY_KEY.get(self.key)
 
     @property
     def action_str(self) -> str:
@@ -237,9 +287,10 @@ class MappingProperties(PropertyGroup):
         t2: NlaTrackRef = self.nla_track2
         t1.object = obj
         t2.object = obj
-        for msi in MouthShapeInfos.all():
-            item: MappingItem = self.items.add()
-            item.key = msi.key
+        keys = [msi.key for msi in MouthShapeInfos.all()]  # Collect plain values first, then do the RNA inserts in one tight loop
+        add = self.items.add
+        for key in keys:
+            add().key = key
         # self.only_shapekeys=ui_utils.does_object_support_shapekey_actions(obj)
         # Assume any mesh would use shape-keys by default (even when there are no shape-keys created yet)
         self.only_shapekeys = bool(obj.type == "MESH")
@@ -256,17 +307,17 @@ class MappingProperties(PropertyGroup):
     @property
     def has_any_mapping(self) -> bool:
         """Has any Action mapped at all"""
-        if not self.items or len(self.items) <= 0:
-            return False
-        for i in self.items:
-            mi: MappingItem = i
-            if mi.action:
-                return True
-        return False
+        return any(mi.action for mi in self.items)
+
+    def iter_blank_keys(self) -> Generator[str, Any, None]:
+        """Keys with no Action mapped. Lazy, callers checking just the first hit need not scan all items."""
+        for mi in self.items:
+            if not mi.action:
+                yield mi.key
 
     @property
     def blank_keys(self) -> list[str]:
-        return [mi.key for mi in self.items or [] if not mi.action]
+        return list(self.iter_blank_keys())
 
     @staticmethod
     def from_context(ctx: Context) -> Optional['MappingProperties']:
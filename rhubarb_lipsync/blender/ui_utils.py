@@ -28,10 +28,10 @@ def find_areas_by_type(context: Context, area_type: str) -> Iterator[tuple[Windo
 
 def get_sequencer_context(context: Context) -> dict:
     """Context needed for sequencer ops (visible sequencer is needed)"""
-    areas = list(find_areas_by_type(context, 'SEQUENCE_EDITOR'))
-    if not areas:
+    first = next(find_areas_by_type(context, 'SEQUENCE_EDITOR'), None)
+    if first is None:
         return {}
-    (window, area) = areas[0]
+    (window, area) = first
     return {
         "window": window,
         "screen": window.screen,
@@ -49,19 +49,19 @@ def draw_expandable_header(props: Any, property_name: str, label: str, layout: U
     Expanded/collapsed state is driven by the provided property.
     Returns the expanded status. Inspired by GameRigtTool plugin"""
     assert props and property_name, f"Blank '{property_name}' or '{props}'"
+    expanded = getattr(props, property_name)  # Checked before any UI-element allocation
     row = layout.row(align=True)
     row.alignment = "LEFT"
 
-    expanded = getattr(props, property_name)
     if expanded:
         # icon = 'TRIA_DOWN'
         icon = 'DISCLOSURE_TRI_DOWN'
+    elif errors:
+        row.alert = True
+        icon = "ERROR"
     else:
         # icon = 'TRIA_RIGHT'
         icon = 'DISCLOSURE_TRI_RIGHT'
-        if errors:
-            row.alert = True
-            icon = "ERROR"
 
     row.prop(props, property_name, text=label, emboss=False, icon=icon)
 
@@ -95,6 +95,8 @@ def draw_error(layout, msg: str) -> None:
 def to_relative_path(blender_path: str) -> str:
     if not blender_path:
         return ""
+    if blender_path.startswith('//'):
+        return blender_path  # Already Blender-relative, skip the C-call
     try:  # Can fail on windows
         return bpy.path.relpath(blender_path)
     except ValueError:
@@ -104,6 +106,8 @@ def to_relative_path(blender_path: str) -> str:
 def to_abs_path(blender_path: str) -> str:
     if not blender_path:
         return ""
+    if not blender_path.startswith('//'):
+        return blender_path  # Not Blender-relative, bpy.path.abspath would return it unchanged
     return bpy.path.abspath(blender_path)
 
 
@@ -0,0 +1,123 @@
+"""Static registry of all the addon classes and modules.
+
+Registering from this pre-declared tuple via `bpy.utils.register_classes_factory`
+avoids the package scanning and class toposorting the `AutoLoader` does on every
+Blender start. The classes are listed dependency-first by hand:
+PropertyGroups before the groups pointing to them, parent panels before their children.
+"""
+import bpy
+
+from .blender import (
+    auto_load,
+    baking_operators,
+    baking_utils,
+    capture_operators,
+    capture_panel,
+    capture_properties,
+    cue_uilist,
+    dropdown_helper,
+    icons_manager,
+    map_and_bake_panel,
+    mapping_operators,
+    mapping_properties,
+    mapping_uilist,
+    mapping_utils,
+    misc_operators,
+    preferences,
+    rhubarb_operators,
+    sound_operators,
+    strip_placement_preferences,
+    ui_utils,
+)
+from .rhubarb import cue_processor, log_manager, mouth_cues, mouth_shape_info, rhubarb_command
+
+#: All the addon submodules. Used by the `LogManager` to discover the per-module loggers.
+modules = [
+    auto_load,
+    baking_operators,
+    baking_utils,
+    capture_operators,
+    capture_panel,
+    capture_properties,
+    cue_uilist,
+    dropdown_helper,
+    icons_manager,
+    map_and_bake_panel,
+    mapping_operators,
+    mapping_properties,
+    mapping_uilist,
+    mapping_utils,
+    misc_operators,
+    preferences,
+    rhubarb_operators,
+    sound_operators,
+    strip_placement_preferences,
+    ui_utils,
+    cue_processor,
+    log_manager,
+    mouth_cues,
+    mouth_shape_info,
+    rhubarb_command,
+]
+
+classes = (
+    # Preference property groups first, the addon preferences point to them
+    strip_placement_preferences.StripPlacementPreferences,
+    preferences.CueListPreferences,
+    preferences.MappingPreferences,
+    preferences.RhubarbAddonPreferences,
+    # Capture property groups, leaves first
+    capture_properties.MouthCueListItem,
+    capture_properties.MouthCueList,
+    capture_properties.JobProperties,
+    capture_properties.ResultLogItemProperties,
+    capture_properties.ResultLogListProperties,
+    capture_properties.CaptureProperties,
+    capture_properties.CaptureListProperties,
+    # Mapping property groups
+    mapping_properties.NlaTrackRef,
+    mapping_properties.MappingItem,
+    mapping_properties.MappingProperties,
+    # UI lists
+    cue_uilist.MouthCueUIList,
+    mapping_uilist.MappingUIList,
+    # Operators
+    rhubarb_operators.ProcessSoundFile,
+    rhubarb_operators.GetRhubarbExecutableVersion,
+    sound_operators.CreateSoundStripWithSound,
+    sound_operators.RemoveSoundStripWithSound,
+    sound_operators.ConvertSoundFromat,
+    sound_operators.ToggleRelativePath,
+    capture_operators.CreateCaptureProps,
+    capture_operators.DeleteCaptureProps,
+    capture_operators.ClearCueList,
+    capture_operators.ImportJsonCueList,
+    capture_operators.ExportCueList2Json,
+    mapping_operators.ListFilteredActions,
+    mapping_operators.BuildCueInfoUIList,
+    mapping_operators.ShowCueInfoHelp,
+    mapping_operators.ClearMappedActions,
+    mapping_operators.CreateNLATrack,
+    mapping_operators.SetActionFrameRange,
+    mapping_operators.SetShiftActionFrameRangeStart,
+    mapping_operators.PreviewMappingAction,
+    baking_operators.RemoveCapturedNlaStrips,
+    baking_operators.PlacementBlendInOutRatioPreset,
+    baking_operators.PlacementScaleFromPreset,
+    baking_operators.PlacementCueTrimFromPreset,
+    baking_operators.ShowPlacementHelp,
+    baking_operators.BakeToNLA,
+    misc_operators.PlayRange,
+    misc_operators.ShowResultLogDetails,
+    misc_operators.SetLogLevel,
+    misc_operators.CheckForUpdates,
+    # Panels, parents before children
+    capture_panel.CaptureMouthCuesPanel,
+    capture_panel.CueListOptionsPanel,
+    capture_panel.CueListColsVisibilityPanel,
+    capture_panel.CaptureExtraOptionsPanel,
+    map_and_bake_panel.MappingAndBakingPanel,
+    map_and_bake_panel.MappingListOptionsPanel,
+)
+
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
@@ -1,3 +1,5 @@
+import logging
+import math
 from dataclasses import dataclass, field
 from typing import Callable, Iterable, Optional
 
@@ -78,55 +80,59 @@ class CueProcessor:
         modified = 0
         for i, cf in self.find_cues_by_duration(-1, max_dur, self.trim_tolerance):
             modified += 1
-            new_end = cf.cue.start + max_dur
+            c = cf.cue
+            new_end = c.start + max_dur
             if append_x:
-                cf_silence = self.create_silence_cue(new_end, cf.cue.end)
+                cf_silence = self.create_silence_cue(new_end, c.end)
                 # Insert the new X after the current trimmed X, encountering previous insertions as they shift the indices
                 self.cue_frames.insert(i + modified, cf_silence)
-            cf.cue.end = new_end  # Trim duration
+            c.end = new_end  # Trim duration
 
-        if modified > 0:
-            log.info(f"Trimmed {modified} Cues as they were too long.")
+        if modified > 0 and log.isEnabledFor(logging.INFO):
+            log.info("Trimmed %d Cues as they were too long.", modified)
         return modified
 
     def merge_double_x(self) -> int:
+        # Single forward pass building a new list. The previous version copied the list
+        # and popped the duplicates one by one which shifts the tail on each removal.
         modified = 0
-        orig_list = list(self.cue_frames)
-        for i, cf in enumerate(orig_list):
-            if i <= 0:
-                continue
-            if not self.is_cue_silence(cf):
-                continue
-            prev_cue = orig_list[i - 1]
-            if not self.is_cue_silence(prev_cue):
+        merged: list[MouthCueFrames] = []
+        for cf in self.cue_frames:
+            if merged and self.is_cue_silence(cf) and self.is_cue_silence(merged[-1]):
+                merged[-1].cue.end = cf.cue.end  # Prolong prev X end up to this X end
+                modified += 1
                 continue
-            prev_cue.cue.end = cf.cue.end  # Prolong prev X end up to this X end
-            removed = self.cue_frames.pop(i - modified)  # Remove the current X
-            assert removed == cf
-            modified += 1
-            prev_cue = cf
+            merged.append(cf)
 
         if modified > 0:
-            log.info(f"Removed {modified} X-Cues as they duplicate.")
+            self.cue_frames[:] = merged
+            if log.isEnabledFor(logging.INFO):
+                log.info("Removed %d X-Cues as they duplicate.", modified)
         return modified
 
     def ensure_frame_intersection(self) -> int:
         """Finds extremely short cues where there is no intersection with a frame and move either start or end to the closest frame time"""
         modified = 0
+        # The frame numbers are derived from two time2frame conversions per cue instead of going
+        # through the MouthCueFrames properties which would redo the same conversion up to six times
+        fps, fps_base, offset = self.frame_cfg.fps_base_offset
         for cf in self.cue_frames:
-            if cf.intersects_frame:
-                continue
+            c = cf.cue
+            start_f = time2frame_float(c.start, fps, fps_base)
+            end_f = time2frame_float(c.end, fps, fps_base)
+            if math.floor(end_f) - math.ceil(start_f) >= 0:
+                continue  # An integer frame number intersects the cue interval
             # Cue is in the middle of two frames, find which end is closer to a frame
-            d_start = cf.start_frame_float - cf.start_frame_left
-            d_end = cf.end_frame_right - cf.end_frame_float
+            d_start = start_f - math.floor(start_f)
+            d_end = math.ceil(end_f) - end_f
             assert d_start > 0 and d_end > 0
             if d_start < d_end:  # Start is closer, expand the cue start to the left
-                cf.cue.start = self.frame2time(cf.start_frame_left)
+                c.start = self.frame2time(math.floor(start_f) + offset)
             else:  # End is closer, expand the cue end to the right
-                cf.cue.end = self.frame2time(cf.end_frame_right)
+                c.end = self.frame2time(math.ceil(end_f) + offset)
             modified += 1
-        if modified > 0:
-            log.info(f"Prolonged {modified} Cues as they were too short and would not have been visible.")
+        if modified > 0 and log.isEnabledFor(logging.INFO):
+            log.info("Prolonged %d Cues as they were too short and would not have been visible.", modified)
         return modified
 
     def optimize_cues(self, max_cue_duration=0.2) -> str:
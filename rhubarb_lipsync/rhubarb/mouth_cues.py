@@ -8,6 +8,11 @@ from .mouth_shape_info import MouthShapeInfo, MouthShapeInfos
 
 log = logging.getLogger(__name__)
 
+# Hoisted silence-cue key symbols. The cue-optimization passes compare against these per cue
+# and going through the Enum machinery (attribute + .value + .key) each time adds up.
+_X_KEY = MouthShapeInfos.X.value.key
+_A_KEY = MouthShapeInfos.A.value.key
+
 
 def time2frame_float(time: float, fps: int, fps_base=1.0) -> float:
     assert fps > 0 and fps_base > 0, f"Can't convert to frame when fps is {fps}/{fps_base}"
@@ -155,19 +160,19 @@ class MouthCueFrames:
 
     @staticmethod
     def create_X(frame_cfg: FrameConfig, start: float, end: float) -> 'MouthCueFrames':
-        return MouthCueFrames(cue=MouthCue(MouthShapeInfos.X.value.key, start, end), frame_cfg=frame_cfg)
+        return MouthCueFrames(cue=MouthCue(_X_KEY, start, end), frame_cfg=frame_cfg)
 
     @staticmethod
     def create_A(frame_cfg: FrameConfig, start: float, end: float) -> 'MouthCueFrames':
-        return MouthCueFrames(cue=MouthCue(MouthShapeInfos.A.value.key, start, end), frame_cfg=frame_cfg)
+        return MouthCueFrames(cue=MouthCue(_A_KEY, start, end), frame_cfg=frame_cfg)
 
     @property
     def is_X(self) -> bool:
-        return self.cue.key == MouthShapeInfos.X.value.key
+        return self.cue.key == _X_KEY
 
     @property
     def is_A(self) -> bool:
-        return self.cue.key == MouthShapeInfos.A.value.key
+        return self.cue.key == _A_KEY
 
     @docstring_from(MouthCue.get_start_frame_float)  # type: ignore[misc]
     @property
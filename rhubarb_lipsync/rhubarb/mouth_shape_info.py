@@ -1,5 +1,6 @@
 import textwrap
 from enum import Enum
+from functools import cached_property
 
 
 class MouthShapeInfo:
@@ -12,6 +13,11 @@ class MouthShapeInfo:
         self.key_displ = key_displ
         self.extended = extended
 
+    @cached_property
+    def description_lines(self) -> list[str]:
+        """The description split to lines. Computed once, the help popup redraws while shown."""
+        return self.description.splitlines()
+
     def __str__(self) -> str:
         return f"({self.key})-'{self.short_dest}'"
 
@@ -146,3 +152,7 @@ class MouthShapeInfos(Enum):
         if index >= len(all) or index < 0:
             return all[-1]  # Return 'X' for out-of-range indices
         return all[index]
+
+
+#: Direct key to MouthShapeInfo lookup. Avoids the Enum __getitem__ machinery in per-redraw paths.
+MOUTH_SHAPE_BY_KEY: dict[str, MouthShapeInfo] = {m.name: m.value for m in MouthShapeInfos}
@@ -56,7 +56,7 @@ class RhubarbParser:
 
     @staticmethod
     def parse_version_info(stdout: str) -> str:
-        m = re.search(RhubarbParser.version_info_rx, stdout)
+        m = RhubarbParser.version_info_rx.search(stdout)
         if m is None:
             return ""
         return m.groupdict()["ver"]
@@ -67,7 +67,8 @@ class RhubarbParser:
         Each report is a json on separate line"""
         if not stderr:
             return []
-        return [RhubarbParser.parse_status_info_line(l) for l in stderr.splitlines()]
+        # Blank lines are dropped here already so the per-line parser isn't entered just to return {}
+        return [RhubarbParser.parse_status_info_line(l) for l in stderr.splitlines() if l]
 
     @staticmethod
     def parse_status_info_line(stderr_line: str) -> Dict[str, Any]:
@@ -138,7 +139,7 @@ class RhubarbCommandWrapper:
 
     thread_wait_timeout = 5
 
-    def __init__(self, executable_path: pathlib.Path, recognizer="pocketSphinx", extended=True, extra_args=[]) -> None:
+    def __init__(self, executable_path: pathlib.Path, recognizer="pocketSphinx", extended=True, extra_args=()) -> None:
         self.executable_path = executable_path
         self.recognizer = recognizer
         self.use_extended = extended
@@ -146,7 +147,8 @@ class RhubarbCommandWrapper:
         self.stdout = ""
         self.stderr = ""
         self.last_exit_code: Optional[int] = None
-        self.extra_args = extra_args
+        self.extra_args = tuple(extra_args)
+        self._version = ""
 
     @staticmethod
     def executable_default_filename() -> str:
@@ -160,8 +162,6 @@ class RhubarbCommandWrapper:
             return f"The '{self.executable_path}' doesn't exist."
         if not self.executable_path.is_file():
             return f"The '{self.executable_path}' is not a valid file."
-        # Zip doesn't maintain file flags, set as executable
-        os.chmod(self.executable_path, 0o744)
         return None
 
     def build_lipsync_args(self, input_file: str, dialog_file: Optional[str] = None) -> list[str]:
@@ -184,13 +184,16 @@ class RhubarbCommandWrapper:
 
     def open_process(self, cmd_args: List[str]) -> None:
         assert not self.was_started
-        assert not self.config_errors(), self.config_errors()
+        errors = self.config_errors()
+        assert not errors, errors
+        # Zip doesn't maintain file flags, set as executable
+        os.chmod(self.executable_path, 0o744)
         self.stdout = ""
         self.stderr = ""
         self.last_exit_code = None
         log.info(f"Starting process\n{cmd_args}")
         # universal_newlines forces text mode
-        self.process = Popen(self.extra_args + cmd_args, stdout=PIPE, stderr=PIPE, universal_newlines=True)
+        self.process = Popen([*self.extra_args, *cmd_args], stdout=PIPE, stderr=PIPE, universal_newlines=True)
 
     def close_process(self) -> None:
         if self.was_started:
@@ -203,12 +206,16 @@ class RhubarbCommandWrapper:
         self.process = None
 
     def get_version(self) -> str:
-        """Execute `lipsync --version` to get the current version of the binary. Synchroinous call."""
+        """Execute `lipsync --version` to get the current version of the binary. Synchroinous call.
+        The result is cached on the instance so the binary is only launched once."""
+        if self._version:
+            return self._version
         self.close_process()
         args = self.build_version_args()
         self.open_process(args)
         self.collect_output_sync(ignore_timeout_error=False)
-        return RhubarbParser.parse_version_info(self.stdout)
+        self._version = RhubarbParser.parse_version_info(self.stdout)
+        return self._version
 
     def log_status_line(self, log_json: dict) -> None:
         # {'log': {'level': 'Info', 'message': 'Msg'}}]
@@ -244,15 +251,22 @@ class RhubarbCommandWrapper:
         status_lines = RhubarbParser.parse_status_infos(self.stderr)
         if not status_lines:
             return None
-        for s in status_lines:
-            self.log_status_line(s)
-        by_type = {j["type"]: j for j in status_lines if j}
-        if "failure" in by_type:
-            raise RuntimeError(f"Rhubarb binary failed:\n{by_type['failure']['reason']}")
-        if "progress" not in by_type:
+        # Single pass, only the failure and the (last) progress entries are of interest
+        failure = progress = None
+        for j in status_lines:
+            if not j:
+                continue
+            self.log_status_line(j)
+            t = j.get("type")
+            if t == "failure":
+                failure = j
+            elif t == "progress":
+                progress = j
+        if failure is not None:
+            raise RuntimeError(f"Rhubarb binary failed:\n{failure['reason']}")
+        if progress is None:
             return None
-        v = by_type["progress"]["value"]
-        return int(v * 100)
+        return int(progress["value"] * 100)
 
     @property
     def was_started(self) -> bool:
@@ -298,6 +312,16 @@ class RhubarbCommandWrapper:
                 raise
         self.close_process()
 
+    def wait(self, timeout: float) -> bool:
+        """Block until the process exits or the timeout elapses. Returns True when it has exited.
+        Unlike sleep-polling this wakes the moment the child terminates."""
+        assert self.was_started
+        try:
+            self.process.wait(timeout=timeout)
+            return True
+        except TimeoutExpired:
+            return False
+
     def check_process_has_finished(self) -> bool:
         exit_code = self.process.poll()
         if exit_code is None:
@@ -344,7 +368,8 @@ class RhubarbCommandAsyncJob:
         self.stderr_thread: Optional[Thread] = None
         self.queue: SimpleQueue[tuple[str, Any]] = SimpleQueue()
         self.last_progress = 0
-        self.last_exception: Optional[Exception] = None
+        self._last_exception: Optional[Exception] = None
+        self._formatted_exception = ""
         self.last_cues: list[MouthCue] = []
         self.stop_event = Event()
 
@@ -428,6 +453,20 @@ class RhubarbCommandAsyncJob:
         self.last_cues = self.cmd.get_lipsync_output_cues()  # Cache the result
         return self.last_cues
 
+    @property
+    def last_exception(self) -> Optional[Exception]:
+        return self._last_exception
+
+    @last_exception.setter
+    def last_exception(self, ex: Optional[Exception]) -> None:
+        self._last_exception = ex
+        # Pre-format the error message once here so the UI doesn't re-join the args on each redraw
+        self._formatted_exception = "" if ex is None else f"{type(ex).__name__}\n{' '.join(map(str, ex.args))}"
+
+    @property
+    def formatted_exception(self) -> str:
+        return self._formatted_exception
+
     @property
     def failed(self) -> bool:
         if self.last_exception:
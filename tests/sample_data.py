@@ -3,6 +3,7 @@ from functools import cached_property
 from pathlib import Path
 from typing import cast
 
+import numpy as np
 from bpy.types import Context, Sound, SoundSequence
 
 from rhubarb_lipsync.rhubarb.mouth_cues import MouthCue
@@ -53,10 +54,23 @@ class SampleData:
     def compare_cues(a_cues: list[MouthCue], b_cues: list[MouthCue]) -> str:
         if len(a_cues) != len(b_cues):
             return f"Lengths don't match \n{a_cues}\n{b_cues}"
-        for i, (a, b) in enumerate(zip(a_cues, b_cues)):
-            if a != b:
-                return f"Cues at position {i} don't match:\n{a}\n{b}"
-        return None
+        n = len(a_cues)
+        if n == 0:
+            return None
+        # Column-wise numpy comparison, reports all mismatching positions at once.
+        # The time tolerance mirrors MouthCue.__eq__ (isclose with abs_tol 0.001).
+        a_start = np.fromiter((c.start for c in a_cues), dtype=np.float64, count=n)
+        b_start = np.fromiter((c.start for c in b_cues), dtype=np.float64, count=n)
+        a_end = np.fromiter((c.end for c in a_cues), dtype=np.float64, count=n)
+        b_end = np.fromiter((c.end for c in b_cues), dtype=np.float64, count=n)
+        a_key = np.fromiter((c.key for c in a_cues), dtype="U1", count=n)
+        b_key = np.fromiter((c.key for c in b_cues), dtype="U1", count=n)
+        matches = np.isclose(a_start, b_start, atol=0.001) & np.isclose(a_end, b_end, atol=0.001) & (a_key == b_key)
+        if matches.all():
+            return None
+        mismatched = np.where(~matches)[0]
+        i = mismatched[0]
+        return f"Cues at position(s) {mismatched.tolist()} don't match:\n{a_cues[i]}\n{b_cues[i]}"
 
     def compare_cues_with_expected(self, b_cues: list[MouthCue]) -> str:
         return SampleData.compare_cues(self.expected_cues, b_cues)
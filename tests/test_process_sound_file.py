@@ -1,29 +1,65 @@
+import concurrent.futures
 import logging
+import os
+import select
 import unittest
 from functools import cached_property
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
+from typing import Optional
 
 import rhubarb_lipsync.rhubarb.rhubarb_command as rhubarb_command
 
 # import tests.sample_data
 import sample_data
+from rhubarb_lipsync.rhubarb.log_manager import logManager
 from rhubarb_lipsync.rhubarb.rhubarb_command import RhubarbCommandAsyncJob, RhubarbCommandWrapper, RhubarbParser
 
 
 def enableDebug() -> None:
+    logManager.ensure_trace()  # The reader threads log on the custom TRACE level
     logging.basicConfig()
     rhubarb_command.log.setLevel(logging.DEBUG)
 
 
+PROJECT_DIR = Path(__file__).parents[1]
+
+
+def find_executable() -> Path:
+    ret = PROJECT_DIR / "rhubarb_lipsync" / "bin" / RhubarbCommandWrapper.executable_default_filename()
+    if ret.exists():
+        return ret
+    return PROJECT_DIR / "addons" / "rhubarb_lipsync" / "bin" / RhubarbCommandWrapper.executable_default_filename()
+
+
+EXECUTABLE_PATH = find_executable()
+
+
+def open_pidfd(r: RhubarbCommandWrapper) -> Optional[int]:
+    """File descriptor signalling the child-process exit. None when not supported (non-Linux, old kernel)."""
+    try:
+        return os.pidfd_open(r.process.pid)  # type: ignore[attr-defined]
+    except (AttributeError, OSError):
+        return None
+
+
+def sleep_or_child_exit(pidfd: Optional[int], delay: float) -> None:
+    """Sleep up to delay seconds but wake up immediately when the child process exits."""
+    if pidfd is None:
+        sleep(delay)
+        return
+    select.select([pidfd], [], [], delay)
+
+
 def wait_until_finished(r: RhubarbCommandWrapper) -> None:
     assert r.was_started
-    for i in range(0, 1000):
+    deadline = monotonic() + 120
+    while monotonic() < deadline:
         if r.has_finished:
             r.collect_output_sync(ignore_timeout_error=True)
             return
-        sleep(0.1)
-        r.lipsync_check_progress()
+        r.wait(0.5)  # OS-level wait, returns the moment the child exits
+        r.lipsync_check_progress()  # Keep draining stderr for the status updates
 
         # print(f"{p}%")
         # print(r.stderr)
@@ -34,38 +70,38 @@ def wait_until_finished(r: RhubarbCommandWrapper) -> None:
 def wait_until_finished_async(job: RhubarbCommandAsyncJob, only_loop_times=0) -> None:
     assert job.cmd.was_started
     loops = 0
-    for i in range(0, 1000):
-        if job.cmd.has_finished:
-            assert loops > 2, "No progress updates was provided "
-            return
-        sleep(0.1)
-        p = job.lipsync_check_progress_async()
-        if p is not None:
-            loops += 1
-            # print(f"{p}%")
-            if only_loop_times > 0 and loops > only_loop_times:
+    delay = 0.005
+    deadline = monotonic() + 120
+    pidfd = open_pidfd(job.cmd)
+    try:
+        while monotonic() < deadline:
+            if job.cmd.has_finished:
+                assert loops > 2, "No progress updates was provided "
                 return
-        # print(r.stderr)
-        # print(r.stdout)
+            sleep_or_child_exit(pidfd, delay)
+            delay = min(delay * 1.5, 0.1)
+            p = job.lipsync_check_progress_async()
+            if p is not None:
+                loops += 1
+                # print(f"{p}%")
+                if only_loop_times > 0 and loops > only_loop_times:
+                    return
+            # print(r.stderr)
+            # print(r.stdout)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
     assert False, "Seems the process in hanging up"
 
 
 class RhubarbCommandWrapperTest(unittest.TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         enableDebug()
-        self.wrapper = RhubarbCommandWrapper(self.executable_path)
-
-    @cached_property
-    def project_dir(self) -> Path:
-        return Path(__file__).parents[1]
 
-    @cached_property
-    def executable_path(self) -> Path:
-        ret = self.project_dir / "rhubarb_lipsync" / "bin" / RhubarbCommandWrapper.executable_default_filename()
-        if ret.exists():
-            return ret
-        ret = self.project_dir / "addons" / "rhubarb_lipsync" / "bin" / RhubarbCommandWrapper.executable_default_filename()
-        return ret
+    def setUp(self) -> None:
+        # A fresh wrapper per test, the tests assert on its process state (was_started/has_finished)
+        self.wrapper = RhubarbCommandWrapper(EXECUTABLE_PATH)
 
     @cached_property
     def data_short(self) -> sample_data.SampleData:
@@ -167,7 +203,35 @@ class RhubarbParserTest(unittest.TestCase):
         self.assertIsNone(res, res)
 
 
+def run_parallel(test_case_cls, max_workers=3) -> unittest.TestResult:
+    """Run each test method of the case in its own thread. The lipsync tests are I/O-bound
+    on the rhubarb child process and each one gets a fresh wrapper in setUp, so the
+    suite wallclock shrinks to roughly the longest single test."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_case_cls)
+    test_case_cls.setUpClass()  # Calling t.run() on bare TestCases bypasses the class fixtures
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda t: t.run(unittest.TestResult()), suite))
+    finally:
+        test_case_cls.tearDownClass()
+    combined = unittest.TestResult()
+    for r in results:  # Merged on the main thread only, no locking needed
+        combined.testsRun += r.testsRun
+        combined.errors.extend(r.errors)
+        combined.failures.extend(r.failures)
+        combined.skipped.extend(r.skipped)
+        combined.expectedFailures.extend(r.expectedFailures)
+        combined.unexpectedSuccesses.extend(r.unexpectedSuccesses)
+    return combined
+
+
 if __name__ == '__main__':
     # unittest.main(RhubarbParserTest())
     # unittest.main(RhubarbCommandWrapperTest())
+    if os.environ.get('RHUBARB_PARALLEL') == '1':
+        res = run_parallel(RhubarbCommandWrapperTest)
+        print(f"Ran {res.testsRun} tests, {len(res.failures)} failures, {len(res.errors)} errors")
+        for test, trace in res.failures + res.errors:
+            print(f"{test}\n{trace}")
+        raise SystemExit(0 if res.wasSuccessful() else 1)
     unittest.main()